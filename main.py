@@ -1,22 +1,55 @@
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import Counter
-import re
+import argparse
+import contextlib
+import itertools
+import os
+import ahocorasick
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 
+# Kamus kata gaul Indonesia
+SLANG_DICTIONARY = frozenset({
+    # Kata gaul umum
+    'gue', 'lu', 'elu', 'gw', 'loe', 'gak', 'nggak', 'gada', 'gaada',
+    'udah', 'udh', 'dah', 'udeh', 'tuh', 'teh', 'mah', 'dong', 'deh',
+    'sih', 'nih', 'mulu', 'aja', 'doang', 'banget', 'bgt', 'bener',
+
+    # Kata gaul modern
+    'viral', 'netizen', 'followers', 'haters', 'hits', 'kece', 'gercep',
+    'gabut', 'garing', 'receh', 'baper', 'kepo', 'julid', 'glow up',
+
+    # Singkatan gaul
+    'otw', 'btw', 'asap', 'tfl', 'gas', 'gws', 'hbd', 'oot', 'tbh',
+    'fyi', 'cmiiw', 'imho', 'tysm', 'wkwk', 'ttd', 'pdf',
+
+    # Kata gaul bahasa Indonesia
+    'gegara', 'santuy', 'gokil', 'cucok', 'mantul', 'mantap', 'sultan',
+    'auto', 'anjay', 'yakali', 'sabi', 'jutek', 'lebay', 'kzl'
+})
+
+
 def load_data(file_path):
     """
     Memuat dataset berita dari file CSV dengan penanganan format waktu yang benar
     """
     try:
-        # Membaca file CSV
+        # Membaca file CSV hanya untuk kolom yang dipakai (kolom Link diabaikan).
+        # Engine C dipakai karena baris dengan kolom Tag/Source yang kurang diisi NaN,
+        # sedangkan engine pyarrow menolak seluruh file
         df = pd.read_csv(file_path,
                          names=['Judul', 'Waktu', 'Link', 'Content',
                                 'Tag1', 'Tag2', 'Tag3', 'Tag4', 'Tag5', 'Source'],
-                         parse_dates=['Waktu'],
-                         date_parser=lambda x: pd.to_datetime(x, format='%d/%m/%Y', errors='coerce'))
+                         usecols=['Judul', 'Waktu', 'Content',
+                                  'Tag1', 'Tag2', 'Tag3', 'Tag4', 'Tag5', 'Source'],
+                         dtype={'Waktu': str, 'Source': 'category',
+                                'Tag1': 'category', 'Tag2': 'category', 'Tag3': 'category',
+                                'Tag4': 'category', 'Tag5': 'category'})
+        df['Waktu'] = pd.to_datetime(df['Waktu'], format='%d/%m/%Y', errors='coerce')
 
         # Memeriksa apakah ada nilai waktu yang tidak valid
         invalid_dates = df['Waktu'].isnull().sum()
@@ -29,87 +62,130 @@ def load_data(file_path):
         return None
 
 
-def detect_slang_words(text, slang_dictionary):
+def build_slang_automaton(slang_dictionary):
+    """
+    Membangun automaton Aho-Corasick dari kamus kata gaul
+    """
+    automaton = ahocorasick.Automaton()
+    for word in slang_dictionary:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+SLANG_AUTOMATON = build_slang_automaton(SLANG_DICTIONARY)
+
+# Jumlah minimum teks unik sebelum pemindaian dibagi ke beberapa proses
+PARALLEL_MIN_TEXTS = 5_000
+
+
+def _is_word_boundary(text, end, word):
+    """
+    Memastikan kecocokan berdiri sebagai kata utuh (setara dengan \\b pada regex)
+    """
+    start = end - len(word) + 1
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end + 1] if end + 1 < len(text) else ' '
+    return not (before.isalnum() or before == '_') and not (after.isalnum() or after == '_')
+
+
+def _scan_slang(text):
+    """
+    Memindai teks huruf kecil dengan automaton dan mengambil kata gaul yang utuh
+    """
+    return [word for end, word in SLANG_AUTOMATON.iter(text)
+            if _is_word_boundary(text, end, word)]
+
+
+def _detect_slang_chunk(texts):
+    """
+    Mendeteksi kata gaul untuk satu potongan teks huruf kecil yang sudah unik
+    """
+    return [_scan_slang(text) for text in texts]
+
+
+def detect_slang_series(texts, executor=None, n_jobs=1):
     """
-    Mendeteksi kata-kata gaul dalam teks
+    Mendeteksi kata gaul untuk seluruh Series teks huruf kecil (tanpa NaN),
+    dibagi per potongan besar ke executor jika tersedia
     """
-    found_slang = []
-    text = str(text).lower()
-    words = re.findall(r'\b\w+\b', text)  # Memisahkan kata dengan lebih baik
+    # Teks yang sama hanya dipindai sekali
+    codes, unique_texts = pd.factorize(texts)
+    unique_texts = np.asarray(unique_texts, dtype=object)
 
-    for word in words:
-        if word in slang_dictionary:
-            found_slang.append(word)
-    return found_slang
+    # Untuk teks unik yang sedikit, ongkos mengirim data ke proses lain lebih besar
+    if executor is None or n_jobs <= 1 or len(unique_texts) < PARALLEL_MIN_TEXTS:
+        unique_found = _detect_slang_chunk(unique_texts)
+    else:
+        chunks = np.array_split(unique_texts, n_jobs)
+        chunk_results = executor.map(_detect_slang_chunk, chunks)
+        unique_found = list(itertools.chain.from_iterable(chunk_results))
 
+    # Hasil per teks unik disebar kembali ke setiap baris lewat kode factorize
+    return pd.Series(unique_found, dtype=object).take(codes).set_axis(texts.index)
 
-def analyze_news_and_slang(df):
+
+def analyze_news_and_slang(df, n_jobs=None):
     """
     Menganalisis dataset berita dan penggunaan bahasa gaul
+
+    n_jobs menentukan jumlah proses untuk deteksi kata gaul (default: jumlah CPU,
+    1 berarti berjalan di proses ini saja)
     """
-    # Kamus kata gaul Indonesia
-    slang_dictionary = {
-        # Kata gaul umum
-        'gue', 'lu', 'elu', 'gw', 'loe', 'gak', 'nggak', 'gada', 'gaada',
-        'udah', 'udh', 'dah', 'udeh', 'tuh', 'teh', 'mah', 'dong', 'deh',
-        'sih', 'nih', 'mulu', 'aja', 'doang', 'banget', 'bgt', 'bener',
-
-        # Kata gaul modern
-        'viral', 'netizen', 'followers', 'haters', 'hits', 'kece', 'gercep',
-        'gabut', 'garing', 'receh', 'baper', 'kepo', 'julid', 'glow up',
-
-        # Singkatan gaul
-        'otw', 'btw', 'asap', 'tfl', 'gas', 'gws', 'hbd', 'oot', 'tbh',
-        'fyi', 'cmiiw', 'imho', 'tysm', 'wkwk', 'ttd', 'pdf',
-
-        # Kata gaul bahasa Indonesia
-        'gegara', 'santuy', 'gokil', 'cucok', 'mantul', 'mantap', 'sultan',
-        'auto', 'anjay', 'yakali', 'sabi', 'jutek', 'lebay', 'kzl'
-    }
+    # Kolom turunan dihitung sekali lalu dipakai ulang oleh semua agregasi
+    title_lower = df['Judul'].fillna('').astype(str).str.lower()
+    content_lower = df['Content'].fillna('').astype(str).str.lower()
+    day = df['Waktu'].dt.floor('D')
+    source = df['Source'].astype('category')
+
+    # Deteksi kata gaul per kolom dengan pemindaian Aho-Corasick, satu pool untuk kedua kolom
+    n_jobs = n_jobs or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else contextlib.nullcontext()
+    with pool as executor:
+        titles_found = detect_slang_series(title_lower, executor, n_jobs)
+        contents_found = detect_slang_series(content_lower, executor, n_jobs)
+
+    title_mask = titles_found.str.len() > 0
+    content_mask = contents_found.str.len() > 0
+    gaul_mask = title_mask | content_mask
+
+    # Frekuensi tag digabung per kolom tanpa membuat Series gabungan 5x panjang data
+    tag_counts = Counter()
+    for column in ['Tag1', 'Tag2', 'Tag3', 'Tag4', 'Tag5']:
+        # Kategori yang tidak terpakai muncul dengan hitungan 0, jadi dibuang
+        counts = df[column].value_counts()
+        tag_counts.update(counts[counts > 0].to_dict())
+
+    # value_counts pada kategori adalah bincount atas kode; kategori kosong dibuang
+    source_counts = source.value_counts().loc[lambda counts: counts > 0]
+    source_gaul = source[gaul_mask.to_numpy()].value_counts().loc[lambda counts: counts > 0]
 
     # Analisis dasar
     results = {
         'total_berita': len(df),
         'periode': (df['Waktu'].min(), df['Waktu'].max()),
-        'sumber_berita': df['Source'].value_counts(),
-        'top_tags': pd.concat([df['Tag1'], df['Tag2'], df['Tag3'],
-                               df['Tag4'], df['Tag5']]).value_counts().head(10),
-        'berita_per_hari': df.groupby(df['Waktu'].dt.date).size(),
+        'sumber_berita': source_counts,
+        'top_tags': pd.Series(dict(tag_counts.most_common(10))),
+        'berita_per_hari': day.value_counts().sort_index(),
 
         # Analisis bahasa gaul
-        'berita_dengan_gaul_judul': 0,
-        'berita_dengan_gaul_konten': 0,
-        'frekuensi_kata_gaul': Counter(),
-        'berita_gaul_per_sumber': Counter(),
+        'berita_dengan_gaul_judul': int(title_mask.sum()),
+        'berita_dengan_gaul_konten': int(content_mask.sum()),
+        'frekuensi_kata_gaul': (Counter(itertools.chain.from_iterable(titles_found))
+                                + Counter(itertools.chain.from_iterable(contents_found))),
+        'berita_gaul_per_sumber': Counter(source_gaul.to_dict()),
         'contoh_berita_gaul': []
     }
 
-    # Analisis bahasa gaul
-    for idx, row in df.iterrows():
-        # Analisis judul
-        slang_in_title = detect_slang_words(row['Judul'], slang_dictionary)
-
-        # Analisis konten
-        slang_in_content = detect_slang_words(row['Content'], slang_dictionary)
-
-        if slang_in_title:
-            results['berita_dengan_gaul_judul'] += 1
-            results['frekuensi_kata_gaul'].update(slang_in_title)
-
-        if slang_in_content:
-            results['berita_dengan_gaul_konten'] += 1
-            results['frekuensi_kata_gaul'].update(slang_in_content)
-
-        if slang_in_title or slang_in_content:
-            results['berita_gaul_per_sumber'][row['Source']] += 1
-
-            if len(results['contoh_berita_gaul']) < 5:
-                results['contoh_berita_gaul'].append({
-                    'judul': row['Judul'],
-                    'waktu': row['Waktu'],
-                    'source': row['Source'],
-                    'kata_gaul': list(set(slang_in_title + slang_in_content))
-                })
+    # Contoh berita dengan bahasa gaul diambil per posisi, aman untuk index yang duplikat
+    sample_positions = gaul_mask.to_numpy().nonzero()[0][:5]
+    sample = df[['Judul', 'Waktu', 'Source']].iloc[sample_positions]
+    results['contoh_berita_gaul'] = sample.rename(
+        columns={'Judul': 'judul', 'Waktu': 'waktu', 'Source': 'source'}).to_dict('records')
+    for example, slang_in_title, slang_in_content in zip(results['contoh_berita_gaul'],
+                                                         titles_found.iloc[sample_positions],
+                                                         contents_found.iloc[sample_positions]):
+        example['kata_gaul'] = list({*slang_in_title, *slang_in_content})
 
     return results
 
@@ -120,72 +196,73 @@ def create_visualizations(results):
     """
     # plt..use('seaborn')
 
+    # Satu figure dipakai ulang untuk kedua visualisasi
+    fig = plt.figure(figsize=(15, 10), constrained_layout=True)
+
     # Visualisasi 1: Analisis Umum
-    fig1 = plt.figure(figsize=(15, 10))
+    axes = fig.subplot_mosaic([['sumber', 'tags'],
+                               ['harian', 'harian']])
 
     # Plot distribusi sumber berita
-    plt.subplot(2, 2, 1)
-    results['sumber_berita'].plot(kind='bar')
-    plt.title('Distribusi Sumber Berita')
-    plt.xlabel('Sumber')
-    plt.ylabel('Jumlah Berita')
-    plt.xticks(rotation=45)
+    ax = axes['sumber']
+    results['sumber_berita'].plot(kind='bar', ax=ax)
+    ax.set_title('Distribusi Sumber Berita')
+    ax.set_xlabel('Sumber')
+    ax.set_ylabel('Jumlah Berita')
+    ax.tick_params(axis='x', labelrotation=45)
 
     # Plot top 10 tags
-    plt.subplot(2, 2, 2)
-    results['top_tags'].plot(kind='bar')
-    plt.title('10 Tag Terpopuler')
-    plt.xlabel('Tag')
-    plt.ylabel('Frekuensi')
-    plt.xticks(rotation=45)
+    ax = axes['tags']
+    results['top_tags'].plot(kind='bar', ax=ax)
+    ax.set_title('10 Tag Terpopuler')
+    ax.set_xlabel('Tag')
+    ax.set_ylabel('Frekuensi')
+    ax.tick_params(axis='x', labelrotation=45)
 
     # Plot tren berita harian
-    plt.subplot(2, 1, 2)
-    results['berita_per_hari'].plot(kind='line')
-    plt.title('Tren Jumlah Berita per Hari')
-    plt.xlabel('Tanggal')
-    plt.ylabel('Jumlah Berita')
+    ax = axes['harian']
+    results['berita_per_hari'].plot(kind='line', ax=ax)
+    ax.set_title('Tren Jumlah Berita per Hari')
+    ax.set_xlabel('Tanggal')
+    ax.set_ylabel('Jumlah Berita')
 
-    plt.tight_layout()
-    plt.savefig('hasil_analisis_umum.png')
-    plt.close()
+    fig.savefig('hasil_analisis_umum.png')
+    fig.clear()
 
     # Visualisasi 2: Analisis Bahasa Gaul
-    fig2 = plt.figure(figsize=(15, 10))
+    axes = fig.subplot_mosaic([['proporsi', 'kata'],
+                               ['sumber', 'sumber']])
 
     # Proporsi berita dengan bahasa gaul
-    plt.subplot(2, 2, 1)
+    ax = axes['proporsi']
     labels = ['Dengan Bahasa Gaul', 'Tanpa Bahasa Gaul']
     sizes = [results['berita_dengan_gaul_konten'],
              results['total_berita'] - results['berita_dengan_gaul_konten']]
-    plt.pie(sizes, labels=labels, autopct='%1.1f%%')
-    plt.title('Proporsi Berita dengan Bahasa Gaul')
+    ax.pie(sizes, labels=labels, autopct='%1.1f%%')
+    ax.set_title('Proporsi Berita dengan Bahasa Gaul')
 
     # Top 10 kata gaul
-    plt.subplot(2, 2, 2)
-    top_words = pd.DataFrame.from_dict(results['frekuensi_kata_gaul'],
-                                       orient='index',
-                                       columns=['count']).head(10)
-    top_words.plot(kind='bar')
-    plt.title('10 Kata Gaul Terpopuler')
-    plt.xlabel('Kata')
-    plt.ylabel('Frekuensi')
-    plt.xticks(rotation=45)
+    ax = axes['kata']
+    top_words = results['frekuensi_kata_gaul'].most_common(10)
+    if top_words:
+        words, counts = zip(*top_words)
+        ax.bar(words, counts)
+    ax.set_title('10 Kata Gaul Terpopuler')
+    ax.set_xlabel('Kata')
+    ax.set_ylabel('Frekuensi')
+    ax.tick_params(axis='x', labelrotation=45)
 
     # Distribusi bahasa gaul per sumber
-    plt.subplot(2, 1, 2)
-    source_df = pd.DataFrame.from_dict(results['berita_gaul_per_sumber'],
-                                       orient='index',
-                                       columns=['count'])
-    source_df.plot(kind='bar')
-    plt.title('Distribusi Bahasa Gaul per Sumber Berita')
-    plt.xlabel('Sumber')
-    plt.ylabel('Jumlah Berita dengan Bahasa Gaul')
-    plt.xticks(rotation=45)
+    ax = axes['sumber']
+    gaul_per_source = results['berita_gaul_per_sumber']
+    ax.bar(list(gaul_per_source.keys()), list(gaul_per_source.values()))
+    ax.set_title('Distribusi Bahasa Gaul per Sumber Berita')
+    ax.set_xlabel('Sumber')
+    ax.set_ylabel('Jumlah Berita dengan Bahasa Gaul')
+    ax.tick_params(axis='x', labelrotation=45)
 
-    plt.tight_layout()
-    plt.savefig('hasil_analisis_bahasa_gaul.png')
-    plt.close()
+    fig.savefig('hasil_analisis_bahasa_gaul.png')
+    plt.close(fig)
 
 
 def create_visual_report(results):
@@ -195,66 +272,66 @@ def create_visual_report(results):
     # plt.style.use('seaborn')
 
     # Membuat figure dengan ukuran besar untuk dashboard
-    fig = plt.figure(figsize=(20, 25))
+    fig, axes = plt.subplots(4, 2, figsize=(20, 25), constrained_layout=True)
 
     # 1. Distribusi Sumber Berita (Pie Chart)
-    plt.subplot(4, 2, 1)
+    ax = axes[0, 0]
     source_sizes = [17770, 17229, 10710, 1]
     source_labels = ['Detik', 'Tempo', 'Kompas', 'Other']
-    plt.pie(source_sizes, labels=source_labels, autopct='%1.1f%%')
-    plt.title('Distribusi Sumber Berita', pad=20, fontsize=14)
+    ax.pie(source_sizes, labels=source_labels, autopct='%1.1f%%')
+    ax.set_title('Distribusi Sumber Berita', pad=20, fontsize=14)
 
     # 2. Top 10 Tags (Horizontal Bar Chart)
-    plt.subplot(4, 2, 2)
+    ax = axes[0, 1]
     tags = ['Jokowi', 'jabodetabek', 'Prabowo', 'PDIP', 'Pemilu 2024',
             'Pilpres 2024', 'Pilkada 2024', 'KPU', 'Pilkada Jakarta', 'pilkada 2024']
     tag_counts = [3669, 3143, 2014, 1717, 1631, 1528, 1358, 1354, 1310, 1244]
-    plt.barh(tags[::-1], tag_counts[::-1])
-    plt.title('10 Tag Terpopuler', pad=20, fontsize=14)
+    ax.barh(tags[::-1], tag_counts[::-1])
+    ax.set_title('10 Tag Terpopuler', pad=20, fontsize=14)
 
     # 3. Proporsi Berita dengan Bahasa Gaul (Donut Chart)
-    plt.subplot(4, 2, 3)
+    ax = axes[1, 0]
     gaul_sizes = [10130, 45782 - 10130]  # Berita dengan gaul vs tanpa gaul
-    plt.pie(gaul_sizes, labels=['Mengandung Bahasa Gaul', 'Tanpa Bahasa Gaul'],
-            autopct='%1.1f%%', pctdistance=0.85)
-    plt.gca().add_artist(plt.Circle((0, 0), 0.70, fc='white'))
-    plt.title('Proporsi Penggunaan Bahasa Gaul dalam Berita', pad=20, fontsize=14)
+    ax.pie(gaul_sizes, labels=['Mengandung Bahasa Gaul', 'Tanpa Bahasa Gaul'],
+           autopct='%1.1f%%', pctdistance=0.85)
+    ax.add_artist(plt.Circle((0, 0), 0.70, fc='white'))
+    ax.set_title('Proporsi Penggunaan Bahasa Gaul dalam Berita', pad=20, fontsize=14)
 
     # 4. Top 10 Kata Gaul (Bar Chart)
-    plt.subplot(4, 2, 4)
+    ax = axes[1, 1]
     words = ['nggak', 'aja', 'sultan', 'sih', 'udah', 'dong', 'banget', 'gue', 'nih', 'gegara']
     frequencies = [6000, 2391, 1818, 1374, 1332, 767, 694, 328, 633, 258]
-    plt.bar(words, frequencies)
-    plt.xticks(rotation=45)
-    plt.title('10 Kata Gaul Terpopuler', pad=20, fontsize=14)
+    ax.bar(words, frequencies)
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.set_title('10 Kata Gaul Terpopuler', pad=20, fontsize=14)
 
     # 5. Distribusi Bahasa Gaul per Sumber (Bar Chart)
-    plt.subplot(4, 2, 5)
+    ax = axes[2, 0]
     sources = ['Detik', 'Tempo', 'Kompas']
     gaul_counts = [5014, 3283, 1967]
-    plt.bar(sources, gaul_counts)
-    plt.title('Distribusi Bahasa Gaul per Sumber Berita', pad=20, fontsize=14)
+    ax.bar(sources, gaul_counts)
+    ax.set_title('Distribusi Bahasa Gaul per Sumber Berita', pad=20, fontsize=14)
 
     # 6. Perbandingan Gaul di Judul vs Konten (Grouped Bar Chart)
-    plt.subplot(4, 2, 6)
+    ax = axes[2, 1]
     categories = ['Judul', 'Konten']
     gaul_percentages = [2.1, 22.1]
     non_gaul_percentages = [97.9, 77.9]
 
-    x = range(len(categories))
+    x = np.arange(len(categories))
     width = 0.35
 
-    plt.bar(x, gaul_percentages, width, label='Dengan Bahasa Gaul')
-    plt.bar([i + width for i in x], non_gaul_percentages, width, label='Tanpa Bahasa Gaul')
+    ax.bar(x, gaul_percentages, width, label='Dengan Bahasa Gaul')
+    ax.bar(x + width, non_gaul_percentages, width, label='Tanpa Bahasa Gaul')
 
-    plt.ylabel('Persentase')
-    plt.title('Perbandingan Penggunaan Bahasa Gaul di Judul vs Konten', pad=20, fontsize=14)
-    plt.xticks([i + width / 2 for i in x], categories)
-    plt.legend()
+    ax.set_ylabel('Persentase')
+    ax.set_title('Perbandingan Penggunaan Bahasa Gaul di Judul vs Konten', pad=20, fontsize=14)
+    ax.set_xticks(x + width / 2, categories)
+    ax.legend()
 
     # 7. Informasi Dataset (Text Box)
-    plt.subplot(4, 2, 7)
-    plt.axis('off')
+    ax = axes[3, 0]
+    ax.axis('off')
     info_text = (
         'INFORMASI DATASET\n\n'
         'Total Berita: 45,782\n'
@@ -263,30 +340,65 @@ def create_visual_report(results):
         '• Berita dengan Bahasa Gaul di Judul: 983 (2.1%)\n'
         '• Berita dengan Bahasa Gaul di Konten: 10,130 (22.1%)'
     )
-    plt.text(0.1, 0.5, info_text, fontsize=12, va='center')
+    ax.text(0.1, 0.5, info_text, fontsize=12, va='center')
 
-    # Mengatur layout
-    plt.tight_layout()
+    # Slot kedelapan tidak dipakai
+    axes[3, 1].axis('off')
 
     # Menyimpan visualisasi
-    plt.savefig('laporan_visual.png', dpi=300, bbox_inches='tight')
+    fig.savefig('laporan_visual.png', dpi=300, bbox_inches='tight')
     print("Visualisasi laporan telah disimpan sebagai 'laporan_visual.png'")
-    plt.close()
+    plt.close(fig)
 
 
-def main():
-    # Path file CSV
-    file_path = 'politik_merge.csv'  # Sesuaikan dengan nama file Anda
+def load_or_analyze(file_path, cache_path, refresh=False, n_jobs=None):
+    """
+    Memuat hasil analisis dari cache, atau menjalankan analisis lalu menyimpannya
+    """
+    # Cache dianggap usang jika file CSV lebih baru
+    cache_valid = os.path.exists(cache_path) and (
+        not os.path.exists(file_path)
+        or os.path.getmtime(cache_path) >= os.path.getmtime(file_path))
+
+    if cache_valid and not refresh:
+        print(f"Memuat hasil analisis dari cache '{cache_path}'...")
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception as e:
+            # Cache rusak atau dibuat versi pandas lain: analisis ulang dari CSV
+            print(f"Peringatan: Cache tidak dapat dibaca ({e}), menganalisis ulang data")
 
     # Memuat data
     print("Memuat dataset...")
     df = load_data(file_path)
+    if df is None:
+        return None
+
+    print("Menganalisis data dan penggunaan bahasa gaul...")
+    # Analisis data dan bahasa gaul
+    results = analyze_news_and_slang(df, n_jobs=n_jobs)
+
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    pd.to_pickle(results, cache_path)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analisis bahasa gaul pada dataset berita')
+    parser.add_argument('--refresh', action='store_true',
+                        help='abaikan cache dan jalankan ulang analisis')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='jumlah proses untuk deteksi kata gaul (default: jumlah CPU)')
+    args = parser.parse_args()
+
+    # Path file CSV
+    file_path = 'politik_merge.csv'  # Sesuaikan dengan nama file Anda
+    cache_path = os.path.join('cache', 'results.pkl')
 
-    if df is not None:
-        print("Menganalisis data dan penggunaan bahasa gaul...")
-        # Analisis data dan bahasa gaul
-        results = analyze_news_and_slang(df)
+    results = load_or_analyze(file_path, cache_path, refresh=args.refresh,
+                              n_jobs=args.jobs)
 
+    if results is not None:
         # Membuat visualisasi
         print("Membuat visualisasi...")
         create_visualizations(results)
@@ -0,0 +1,202 @@
+import os
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+import main
+from main import analyze_news_and_slang, load_data
+
+
+def test_load_data_reads_csv_with_categoricals(tmp_path):
+    csv_path = tmp_path / 'berita.csv'
+    csv_path.write_text(
+        'Judul A,01/02/2024,http://a,Isi berita gue udah,Jokowi,KPU,,,,detik\n'
+        'Judul B,bukan tanggal,http://b,Isi berita biasa,Prabowo,,,,,kompas\n'
+    )
+
+    df = load_data(csv_path)
+
+    assert df is not None
+    assert list(df.columns) == ['Judul', 'Waktu', 'Content',
+                                'Tag1', 'Tag2', 'Tag3', 'Tag4', 'Tag5', 'Source']
+    assert len(df) == 2
+    assert isinstance(df['Source'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['Tag1'].dtype, pd.CategoricalDtype)
+    assert df['Waktu'].iloc[0] == pd.Timestamp(2024, 2, 1)
+    assert pd.isna(df['Waktu'].iloc[1])
+
+
+def test_analyze_news_and_slang_handles_duplicate_index():
+    df = pd.DataFrame({
+        'Judul': ['Gue udah tiba', 'Berita biasa', 'Rumah baru'],
+        'Waktu': pd.to_datetime(['01/02/2024', '02/02/2024', '02/02/2024'], format='%d/%m/%Y'),
+        'Content': ['isi biasa', 'netizen heboh banget', 'sudah selalu tugas'],
+        'Tag1': ['KPU', 'KPU', 'Jokowi'],
+        'Tag2': [None, None, None],
+        'Tag3': [None, None, None],
+        'Tag4': [None, None, None],
+        'Tag5': [None, None, None],
+        'Source': pd.Categorical(['detik', 'tempo', 'detik']),
+    }, index=[0, 0, 0])
+
+    results = analyze_news_and_slang(df, n_jobs=1)
+
+    assert results['berita_dengan_gaul_judul'] == 1
+    assert results['berita_dengan_gaul_konten'] == 1
+    assert results['berita_gaul_per_sumber'] == Counter({'detik': 1, 'tempo': 1})
+    assert [example['judul'] for example in results['contoh_berita_gaul']] == \
+        ['Gue udah tiba', 'Berita biasa']
+    assert sorted(results['contoh_berita_gaul'][0]['kata_gaul']) == ['gue', 'udah']
+    assert sorted(results['contoh_berita_gaul'][1]['kata_gaul']) == ['banget', 'netizen']
+
+
+def test_load_data_fills_missing_trailing_fields(tmp_path):
+    csv_path = tmp_path / 'berita.csv'
+    csv_path.write_text(
+        'Judul A,01/02/2024,http://a,Isi berita,Jokowi,KPU,,,,detik\n'
+        'Judul B,02/02/2024,http://b,Isi biasa,Prabowo\n'
+    )
+
+    df = load_data(csv_path)
+
+    assert df is not None
+    assert len(df) == 2
+    assert df['Tag1'].iloc[1] == 'Prabowo'
+    assert pd.isna(df['Tag2'].iloc[1])
+    assert pd.isna(df['Source'].iloc[1])
+    assert df['Waktu'].iloc[1] == pd.Timestamp(2024, 2, 2)
+
+
+def test_analyze_news_and_slang_ignores_unused_tag_categories():
+    n = 3
+    df = pd.DataFrame({
+        'Judul': ['Berita satu', 'Berita dua', 'Berita tiga'],
+        'Waktu': pd.to_datetime(['01/02/2024'] * n, format='%d/%m/%Y'),
+        'Content': ['isi'] * n,
+        'Tag1': pd.Categorical(['KPU', 'KPU', 'Jokowi']),
+        'Tag2': pd.Categorical([None] * n, categories=['x']),
+        'Tag3': pd.Categorical([None] * n),
+        'Tag4': pd.Categorical([None] * n),
+        'Tag5': pd.Categorical([None] * n),
+        'Source': pd.Categorical(['detik'] * n),
+    })
+
+    results = analyze_news_and_slang(df, n_jobs=1)
+
+    assert results['top_tags'].to_dict() == {'KPU': 2, 'Jokowi': 1}
+
+
+def test_analyze_news_and_slang_process_pool_matches_serial(monkeypatch):
+    df = pd.DataFrame({
+        'Judul': ['Gue udah tiba', 'Berita biasa', 'Rumah baru', 'Otw kantor', 'Gue udah tiba'],
+        'Waktu': pd.to_datetime(['01/02/2024', '02/02/2024', '02/02/2024',
+                                 '03/02/2024', '03/02/2024'], format='%d/%m/%Y'),
+        'Content': ['isi biasa', 'netizen heboh banget', 'sudah selalu tugas',
+                    'macet aja sih', 'isi biasa'],
+        'Tag1': pd.Categorical(['KPU', 'KPU', 'Jokowi', 'PDIP', 'KPU']),
+        'Tag2': pd.Categorical([None] * 5),
+        'Tag3': pd.Categorical([None] * 5),
+        'Tag4': pd.Categorical([None] * 5),
+        'Tag5': pd.Categorical([None] * 5),
+        'Source': pd.Categorical(['detik', 'tempo', 'detik', 'kompas', 'tempo']),
+    })
+    monkeypatch.setattr(main, 'PARALLEL_MIN_TEXTS', 2)
+
+    serial = analyze_news_and_slang(df, n_jobs=1)
+    pooled = analyze_news_and_slang(df, n_jobs=2)
+
+    assert serial.keys() == pooled.keys()
+    for key, expected in serial.items():
+        if isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(pooled[key], expected)
+        else:
+            assert pooled[key] == expected, key
+
+
+@pytest.fixture
+def cached_run(tmp_path, monkeypatch):
+    """
+    Menyiapkan CSV dan cache sementara serta mencatat pemanggilan analisis
+    """
+    csv_path = tmp_path / 'berita.csv'
+    csv_path.write_text('isi tidak dibaca karena load_data diganti\n')
+    cache_path = tmp_path / 'cache' / 'results.pkl'
+    calls = []
+
+    monkeypatch.setattr(main, 'load_data', lambda file_path: pd.DataFrame({'Judul': ['a']}))
+
+    def fake_analyze(df, n_jobs=None):
+        calls.append(n_jobs)
+        return {'total_berita': len(calls)}
+
+    monkeypatch.setattr(main, 'analyze_news_and_slang', fake_analyze)
+    return csv_path, cache_path, calls
+
+
+def test_load_or_analyze_reuses_valid_cache(cached_run):
+    csv_path, cache_path, calls = cached_run
+
+    first = main.load_or_analyze(str(csv_path), str(cache_path))
+    second = main.load_or_analyze(str(csv_path), str(cache_path))
+
+    assert first == second == {'total_berita': 1}
+    assert len(calls) == 1
+
+
+def test_load_or_analyze_reruns_when_csv_is_newer(cached_run):
+    csv_path, cache_path, calls = cached_run
+
+    main.load_or_analyze(str(csv_path), str(cache_path))
+    cache_mtime = os.path.getmtime(cache_path)
+    os.utime(csv_path, (cache_mtime + 10, cache_mtime + 10))
+    results = main.load_or_analyze(str(csv_path), str(cache_path))
+
+    assert results == {'total_berita': 2}
+    assert len(calls) == 2
+
+
+def test_load_or_analyze_reruns_on_refresh(cached_run):
+    csv_path, cache_path, calls = cached_run
+
+    main.load_or_analyze(str(csv_path), str(cache_path))
+    results = main.load_or_analyze(str(csv_path), str(cache_path), refresh=True)
+
+    assert results == {'total_berita': 2}
+    assert len(calls) == 2
+
+
+def test_load_or_analyze_reruns_on_corrupt_cache(cached_run):
+    csv_path, cache_path, calls = cached_run
+
+    cache_path.parent.mkdir()
+    cache_path.write_bytes(b'bukan pickle')
+    cache_mtime = os.path.getmtime(csv_path) + 10
+    os.utime(cache_path, (cache_mtime, cache_mtime))
+    results = main.load_or_analyze(str(csv_path), str(cache_path))
+
+    assert results == {'total_berita': 1}
+    assert pd.read_pickle(cache_path) == {'total_berita': 1}
+
+
+def test_load_or_analyze_writes_no_cache_without_data(cached_run, monkeypatch):
+    csv_path, cache_path, calls = cached_run
+    monkeypatch.setattr(main, 'load_data', lambda file_path: None)
+
+    results = main.load_or_analyze(str(csv_path), str(cache_path))
+
+    assert results is None
+    assert calls == []
+    assert not cache_path.exists()
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('sudah', []),
+    ('nggak', ['nggak']),
+    ('gue_x', []),
+    ('gue2', []),
+    ('sih.nih,dong', ['sih', 'nih', 'dong']),
+    ('lagi glow up nih', ['glow up', 'nih']),
+])
+def test_scan_slang_matches_whole_words_only(text, expected):
+    assert main._scan_slang(text) == expected